@@ -135,7 +135,9 @@ def _load_loom(path_to_file: str, gene_names_attribute_name: str = "Gene") -> An
     import loompy
 
     dataset = loompy.connect(path_to_file)
-    select = dataset[:, :].sum(axis=0) > 0  # Take out cells that don't express any gene
+    # read the matrix once, change to cells by genes
+    data = dataset[:, :].T
+    select = data.sum(axis=1) > 0  # Take out cells that don't express any gene
     if not all(select):
         warnings.warn("Removing empty cells")
 
@@ -163,11 +165,15 @@ def _load_loom(path_to_file: str, gene_names_attribute_name: str = "Gene") -> An
         uns_dict[global_key] = dataset.attrs[global_key]
         if type(uns_dict[global_key]) is np.ndarray:
             uns_dict[global_key] = uns_dict[global_key].ravel()
-    data = dataset[:, :].T  # change matrix to cells by genes
     dataset.close()
 
-    adata = AnnData(X=data, obs=obs_dict, var=var_dict, uns=uns_dict, obsm=obsm_dict)
-    adata = adata[select].copy()
+    adata = AnnData(
+        X=data if select.all() else data[select],
+        obs=obs_dict,
+        var=var_dict,
+        uns=uns_dict,
+        obsm=obsm_dict,
+    )
     adata.var_names = gene_names
 
     return adata
@@ -97,14 +97,10 @@ def _load_pbmc_dataset(
     idx_metadata = np.asarray(
         [not barcode.endswith("11") for barcode in barcodes_metadata], dtype=np.bool
     )
-    genes_to_keep = list(
-        de_metadata["ENSG"].values
-    )  # only keep the genes for which we have de data
-    difference = list(
-        set(genes_to_keep).difference(set(adata.var_names))
-    )  # Non empty only for unit tests
-    for gene in difference:
-        genes_to_keep.remove(gene)
+    # only keep the genes for which we have de data
+    # genes missing from var_names only occur in unit tests
+    var_names = set(adata.var_names)
+    genes_to_keep = [g for g in de_metadata["ENSG"].values if g in var_names]
 
     adata = adata[:, genes_to_keep].copy()
     design = pbmc_metadata["design"][idx_metadata]
@@ -19,8 +19,7 @@ def _generate_synthetic(
 ) -> AnnData:
 
     data = np.random.negative_binomial(5, 0.3, size=(batch_size * n_batches, n_genes))
-    mask = np.random.binomial(n=1, p=0.7, size=(batch_size * n_batches, n_genes))
-    data = data * mask  # We put the batch index first
+    data *= np.random.binomial(n=1, p=0.7, size=data.shape)  # dropout, in place
     labels = np.random.randint(0, n_labels, size=(batch_size * n_batches,))
     labels = np.array(["label_%d" % i for i in labels])
 
@@ -85,8 +85,8 @@ def poisson_gene_selection(
         If batch_key is given, this denotes in how many batches genes are detected as zero enriched
 
     """
-    data = adata.layers[layer] if layer is not None else adata.X
-    if _check_nonnegative_integers(data) is False:
+    all_data = adata.layers[layer] if layer is not None else adata.X
+    if _check_nonnegative_integers(all_data) is False:
         raise ValueError("`poisson_gene_selection` expects " "raw count data.")
 
     use_gpu = use_gpu and torch.cuda.is_available()
@@ -101,8 +101,9 @@ def poisson_gene_selection(
     exp_frac_zeross = []
     for b in np.unique(batch_info):
 
-        ad = adata[batch_info == b]
-        data = ad.layers[layer] if layer is not None else ad.X
+        # slice the matrix directly rather than building an AnnData view,
+        # integer rows also read backed data into memory
+        data = all_data[np.flatnonzero(batch_info == b)]
 
         # Calculate empirical statistics.
         scaled_means = torch.from_numpy(np.asarray(data.sum(0) / data.sum()).ravel())
@@ -3,8 +3,8 @@ from pathlib import Path
 from typing import Union
 
 import pandas as pd
+import scipy.sparse as sp_sparse
 from anndata import AnnData
-from scipy.io import mmread
 
 
 def read_10x_atac(base_path: Union[str, Path]) -> AnnData:
@@ -16,7 +16,16 @@ def read_10x_atac(base_path: Union[str, Path]) -> AnnData:
     base_path
         Path to directory with matrix, bed file, etc.
     """
-    data = mmread(os.path.join(base_path, "matrix.mtx")).transpose()
+    try:
+        # parses the text file in parallel, much faster than scipy on large matrices
+        from fast_matrix_market import mmread
+    except ImportError:
+        from scipy.io import mmread
+
+    # transposing the coo matrix only swaps row and col, csr conversion is done once
+    data = sp_sparse.csr_matrix(
+        mmread(os.path.join(base_path, "matrix.mtx")).transpose()
+    )
     coords = pd.read_csv(
         os.path.join(base_path, "peaks.bed"),
         sep="\t",
@@ -41,4 +50,4 @@ def read_10x_atac(base_path: Union[str, Path]) -> AnnData:
     cell_annot.set_index("barcode", inplace=True)
     cell_annot.index = cell_annot.index.astype(str)
 
-    return AnnData(data.tocsr(), var=coords, obs=cell_annot)
+    return AnnData(data, var=coords, obs=cell_annot)
@@ -1,6 +1,6 @@
 import logging
 import warnings
-from typing import Tuple, Union
+from typing import Union
 
 import anndata
 import h5py
@@ -8,25 +8,35 @@ import numpy as np
 import pandas as pd
 import scipy.sparse as sp_sparse
 from anndata._core.sparse_dataset import SparseDataset
-from numba import boolean, float32, float64, int32, int64, vectorize
 
 logger = logging.getLogger(__name__)
 
 
-def _compute_library_size(
-    data: Union[sp_sparse.spmatrix, np.ndarray]
-) -> Tuple[np.ndarray, np.ndarray]:
-    sum_counts = data.sum(axis=1)
-    masked_log_sum = np.ma.log(sum_counts)
-    if np.ma.is_masked(masked_log_sum):
+def _compute_log_library_size(
+    data: Union[sp_sparse.spmatrix, np.ndarray, h5py.Dataset, SparseDataset],
+    chunk_size: int = 10000,
+) -> np.ndarray:
+    # for backed anndata, sum chunks of rows instead of loading the whole matrix
+    if isinstance(data, h5py.Dataset) or isinstance(data, SparseDataset):
+        sum_counts = np.concatenate(
+            [
+                np.asarray(data[i : i + chunk_size].sum(axis=1)).ravel()
+                for i in range(0, data.shape[0], chunk_size)
+            ]
+        )
+    else:
+        sum_counts = np.asarray(data.sum(axis=1)).ravel()
+    empty_cells = sum_counts == 0
+    if empty_cells.any():
         warnings.warn(
             "This dataset has some empty cells, this might fail inference."
             "Data should be filtered with `scanpy.pp.filter_cells()`"
         )
-    log_counts = masked_log_sum.filled(0)
-    local_mean = (np.mean(log_counts).reshape(-1, 1)).astype(np.float32)
-    local_var = (np.var(log_counts).reshape(-1, 1)).astype(np.float32)
-    return local_mean, local_var
+    # log library sizes lie in a small range, float32 is enough
+    log_counts = np.log(
+        sum_counts, where=~empty_cells, out=np.zeros(len(sum_counts), dtype=np.float32)
+    )
+    return log_counts
 
 
 def _compute_library_size_batch(
@@ -61,20 +71,24 @@ def _compute_library_size_batch(
         anndata.AnnData if copy was True, else None
 
     """
-    if batch_key not in adata.obs_keys():
+    if batch_key not in adata.obs.columns:
         raise ValueError("batch_key not valid key in obs dataframe")
-    local_means = np.zeros((adata.shape[0], 1))
-    local_vars = np.zeros((adata.shape[0], 1))
-    batch_indices = adata.obs[batch_key]
+    if layer is not None:
+        if layer not in adata.layers.keys():
+            raise ValueError("layer not a valid key for adata.layers")
+        data = adata.layers[layer]
+    else:
+        data = adata.X
+    # a single pass over the data, batches only index into the per-cell totals
+    log_counts = _compute_log_library_size(data)
+    local_means = np.zeros((adata.shape[0], 1), dtype=np.float32)
+    local_vars = np.zeros((adata.shape[0], 1), dtype=np.float32)
+    batch_indices = adata.obs[batch_key].to_numpy()
     for i_batch in np.unique(batch_indices):
-        idx_batch = np.squeeze(batch_indices == i_batch)
-        if layer is not None:
-            if layer not in adata.layers.keys():
-                raise ValueError("layer not a valid key for adata.layers")
-            data = adata[idx_batch].layers[layer]
-        else:
-            data = adata[idx_batch].X
-        (local_means[idx_batch], local_vars[idx_batch]) = _compute_library_size(data)
+        idx_batch = batch_indices == i_batch
+        batch_log_counts = log_counts[idx_batch]
+        local_means[idx_batch] = np.mean(batch_log_counts, dtype=np.float32)
+        local_vars[idx_batch] = np.var(batch_log_counts, dtype=np.float32)
     if local_l_mean_key is None:
         local_l_mean_key = "_scvi_local_l_mean"
     if local_l_var_key is None:
@@ -111,21 +125,8 @@ def _check_nonnegative_integers(
     n = len(data)
     inds = np.random.permutation(n)[:20]
     check = data.flat[inds]
-    return ~np.any(_is_not_count(check))
-
-
-@vectorize(
-    [
-        boolean(int32),
-        boolean(int64),
-        boolean(float32),
-        boolean(float64),
-    ],
-    target="parallel",
-    cache=True,
-)
-def _is_not_count(d):
-    return d < 0 or d % 1 != 0
+    # plain bool, callers test the result with `is False`
+    return not np.any((check < 0) | (check % 1 != 0))
 
 
 def _get_batch_mask_protein_data(
@@ -139,11 +140,19 @@ def _get_batch_mask_protein_data(
     """
     pro_exp = adata.obsm[protein_expression_obsm_key]
     pro_exp = pro_exp.to_numpy() if isinstance(pro_exp, pd.DataFrame) else pro_exp
-    batches = adata.obs[batch_key].values
+    batches = adata.obs[batch_key].values.ravel()
+    unique_batches, batch_codes = np.unique(batches, return_inverse=True)
+    n_cells = len(batch_codes)
+    # batches by cells indicator, all per batch sums are a single sparse product
+    indicator = sp_sparse.csr_matrix(
+        (np.ones(n_cells), (batch_codes, np.arange(n_cells))),
+        shape=(len(unique_batches), n_cells),
+    )
+    batch_sums = indicator @ pro_exp
+    if sp_sparse.issparse(batch_sums):
+        batch_sums = batch_sums.toarray()
     batch_mask = {}
-    for b in np.unique(batches):
-        b_inds = np.where(batches.ravel() == b)[0]
-        batch_sum = pro_exp[b_inds, :].sum(axis=0)
+    for b, batch_sum in zip(unique_batches, np.asarray(batch_sums)):
         all_zero = batch_sum == 0
         batch_mask[b] = ~all_zero
 
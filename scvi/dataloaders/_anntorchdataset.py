@@ -112,12 +112,13 @@ class AnnTorchDataset(Dataset):
                 # this unsorts it
                 idx = i
 
+            # indexing already returns a new array, only cast when the dtype differs
             if isinstance(data, np.ndarray):
-                data_numpy[key] = data[idx].astype(dtype)
+                data_numpy[key] = data[idx].astype(dtype, copy=False)
             elif isinstance(data, pd.DataFrame):
-                data_numpy[key] = data.iloc[idx, :].to_numpy().astype(dtype)
+                data_numpy[key] = data.iloc[idx, :].to_numpy().astype(dtype, copy=False)
             else:
-                data_numpy[key] = data[idx].toarray().astype(dtype)
+                data_numpy[key] = data[idx].toarray().astype(dtype, copy=False)
 
         return data_numpy
 
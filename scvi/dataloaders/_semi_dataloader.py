@@ -61,11 +61,13 @@ class SemiSupervisedDataLoader(ConcatDataLoader):
         labels_obs_key = adata.uns["_scvi"]["categorical_mappings"][key]["original_key"]
 
         # save a nested list of the indices per labeled category
+        # a stable sort partitions indices by label in a single pass
         self.labeled_locs = []
-        labels = np.unique(adata.obs[labels_obs_key][indices])
-        for label in labels:
+        labels = np.asarray(adata.obs[labels_obs_key]).ravel()[indices]
+        order = np.argsort(labels, kind="stable")
+        unique_labels, starts = np.unique(labels[order], return_index=True)
+        for label, label_loc_idx in zip(unique_labels, np.split(order, starts[1:])):
             if label != unlabeled_category:
-                label_loc_idx = np.where(adata.obs[labels_obs_key][indices] == label)[0]
                 label_loc = indices[label_loc_idx]
                 self.labeled_locs.append(label_loc)
         labelled_idx = self.subsample_labels()
@@ -56,12 +56,15 @@ class CellAssign(UnsupervisedTrainingMixin, BaseModelClass):
         size_factor_key: str,
         **model_kwargs,
     ):
-        try:
-            cell_type_markers = cell_type_markers.loc[adata.var_names]
-        except KeyError:
-            raise KeyError(
-                "Anndata and cell type markers do not contain the same genes."
-            )
+        # markers are often built from the same var_names, nothing to align then
+        if not cell_type_markers.index.equals(adata.var_names):
+            # positions of var_names in the marker index, -1 if missing
+            gene_idx = cell_type_markers.index.get_indexer(adata.var_names)
+            if (gene_idx < 0).any():
+                raise KeyError(
+                    "Anndata and cell type markers do not contain the same genes."
+                )
+            cell_type_markers = cell_type_markers.iloc[gene_idx]
         super().__init__(adata)
 
         register_tensor_from_anndata(adata, "_size_factor", "obs", size_factor_key)
@@ -76,7 +79,8 @@ class CellAssign(UnsupervisedTrainingMixin, BaseModelClass):
         )
 
         x = scvi.data.get_from_registry(adata, _CONSTANTS.X_KEY)
-        col_means = np.asarray(np.mean(x, 0)).ravel()  # (g)
+        # sum in float32, sparse .mean() would upcast to a float64 matrix
+        col_means = np.asarray(x.sum(0), dtype=np.float32).ravel() / x.shape[0]  # (g)
         col_means_mu, col_means_std = np.mean(col_means), np.std(col_means)
         col_means_normalized = torch.Tensor((col_means - col_means_mu) / col_means_std)
 
@@ -159,7 +159,7 @@ class SpatialStereoscope(UnsupervisedTrainingMixin, BaseModelClass):
         prior_weight: Literal["n_obs", "minibatch"] = "n_obs",
         **model_kwargs,
     ):
-        st_adata.obs["_indices"] = np.arange(st_adata.n_obs)
+        st_adata.obs["_indices"] = np.arange(st_adata.n_obs, dtype=np.int32)
         register_tensor_from_anndata(st_adata, "ind_x", "obs", "_indices")
         super().__init__(st_adata)
         self.module = SpatialDeconv(
@@ -174,6 +174,8 @@ class SpatialStereoscope(UnsupervisedTrainingMixin, BaseModelClass):
             st_adata.n_obs,
         )
         self.cell_type_mapping = cell_type_mapping
+        # built once, maps cell type labels to their position in the mapping
+        self._cell_type_index = pd.Index(cell_type_mapping)
         self.init_params_ = self._get_init_params(locals())
 
     @classmethod
@@ -227,7 +229,7 @@ class SpatialStereoscope(UnsupervisedTrainingMixin, BaseModelClass):
 
         column_names = self.cell_type_mapping
         if keep_noise:
-            column_names = column_names.append("noise_term")
+            column_names = np.append(column_names, "noise_term")
         return pd.DataFrame(
             data=self.module.get_proportions(keep_noise),
             columns=column_names,
@@ -253,10 +255,10 @@ class SpatialStereoscope(UnsupervisedTrainingMixin, BaseModelClass):
             warnings.warn(
                 "Trying to query inferred values from an untrained model. Please train the model first."
             )
-        ind_y = np.array([np.where(ct == self.cell_type_mapping)[0][0] for ct in y])
-        if ind_y.shape != y.shape:
+        ind_y = self._cell_type_index.get_indexer(y)
+        if (ind_y < 0).any():
             raise ValueError(
-                "Incorrect shape after matching cell types to reference mapping. Please check cell type query."
+                "Unknown cell type after matching cell types to reference mapping. Please check cell type query."
             )
         px_scale = self.module.get_ct_specific_expression(torch.tensor(ind_y)[:, None])
         return np.array(px_scale.cpu())
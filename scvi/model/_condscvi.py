@@ -7,6 +7,7 @@ import torch
 from anndata import AnnData
 
 from scvi import _CONSTANTS
+from scvi.data import get_from_registry
 from scvi.model.base import (
     BaseModelClass,
     RNASeqMixin,
@@ -63,7 +64,10 @@ class CondSCVI(RNASeqMixin, VAEMixin, UnsupervisedTrainingMixin, BaseModelClass)
         n_labels = self.summary_stats["n_labels"]
         n_vars = self.summary_stats["n_vars"]
         if weight_obs:
-            ct_counts = adata.obs["_scvi_labels"].value_counts()[range(n_labels)].values
+            ct_counts = np.bincount(
+                get_from_registry(adata, _CONSTANTS.LABELS_KEY).ravel(),
+                minlength=n_labels,
+            )
             ct_prop = ct_counts / np.sum(ct_counts)
             ct_prop[ct_prop < 0.05] = 0.05
             ct_prop = ct_prop / np.sum(ct_prop)
@@ -119,17 +123,15 @@ class CondSCVI(RNASeqMixin, VAEMixin, UnsupervisedTrainingMixin, BaseModelClass)
             (self.summary_stats["n_labels"], p, self.module.n_latent)
         )
         var_vprior = np.zeros((self.summary_stats["n_labels"], p, self.module.n_latent))
-        key = self.scvi_setup_dict_["categorical_mappings"]["_scvi_labels"][
-            "original_key"
-        ]
-        mapping = self.scvi_setup_dict_["categorical_mappings"]["_scvi_labels"][
-            "mapping"
-        ]
+        # sort the label codes once, the cells of each label are then a slice
+        labels = get_from_registry(adata, _CONSTANTS.LABELS_KEY).ravel()
+        order = np.argsort(labels, kind="stable")
+        starts = np.searchsorted(
+            labels[order], np.arange(self.summary_stats["n_labels"] + 1)
+        )
         for ct in range(self.summary_stats["n_labels"]):
             # pick p cells
-            local_indices = np.random.choice(
-                np.where(adata.obs[key] == mapping[ct])[0], p
-            )
+            local_indices = np.random.choice(order[starts[ct] : starts[ct + 1]], p)
             # get mean and variance from posterior
             scdl = self._make_data_loader(
                 adata=adata, indices=local_indices, batch_size=p
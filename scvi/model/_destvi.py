@@ -71,7 +71,7 @@ class DestVI(UnsupervisedTrainingMixin, BaseModelClass):
         n_layers: int,
         **module_kwargs,
     ):
-        st_adata.obs["_indices"] = np.arange(st_adata.n_obs)
+        st_adata.obs["_indices"] = np.arange(st_adata.n_obs, dtype=np.int32)
         register_tensor_from_anndata(st_adata, "ind_x", "obs", "_indices")
         super(DestVI, self).__init__(st_adata)
         self.module = MRDeconv(
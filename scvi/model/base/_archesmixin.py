@@ -74,9 +74,7 @@ class ArchesMixin:
                 var_names,
                 load_state_dict,
                 _,
-            ) = _load_saved_files(
-                reference_model, load_adata=False, map_location=device
-            )
+            ) = _load_saved_files(reference_model, load_adata=False, map_location="cpu")
         else:
             attr_dict = reference_model._get_user_attributes()
             attr_dict = {a[0]: a[1] for a in attr_dict if a[0][-1] == "_"}
@@ -102,21 +100,27 @@ class ArchesMixin:
         for attr, val in attr_dict.items():
             setattr(model, attr, val)
 
-        model.to_device(device)
-
-        # model tweaking
+        # model tweaking, done on cpu so that the state dict
+        # is only moved to the target device once
         new_state_dict = model.module.state_dict()
-        for key, load_ten in load_state_dict.items():
-            new_ten = new_state_dict[key]
-            if new_ten.size() == load_ten.size():
-                continue
-            # new categoricals changed size
-            else:
-                dim_diff = new_ten.size()[-1] - load_ten.size()[-1]
-                fixed_ten = torch.cat([load_ten, new_ten[..., -dim_diff:]], dim=-1)
-                load_state_dict[key] = fixed_ten
+        # new categoricals changed size
+        mismatched_keys = [
+            key
+            for key, load_ten in load_state_dict.items()
+            if load_ten.shape != new_state_dict[key].shape
+        ]
+        for key in mismatched_keys:
+            load_ten, new_ten = load_state_dict[key], new_state_dict[key]
+            n_loaded = load_ten.shape[-1]
+            fixed_ten = torch.empty(
+                new_ten.shape, dtype=load_ten.dtype, device=load_ten.device
+            )
+            fixed_ten[..., :n_loaded].copy_(load_ten)
+            fixed_ten[..., n_loaded:].copy_(new_ten[..., n_loaded:])
+            load_state_dict[key] = fixed_ten
 
         model.module.load_state_dict(load_state_dict)
+        model.to_device(device)
         model.module.eval()
 
         _set_params_online_update(
@@ -149,11 +153,12 @@ def _set_params_online_update(
     if unfrozen:
         return
 
-    mod_no_grad = set(["encoder_z2_z1", "decoder_z1_z2"])
+    mod_no_grad = frozenset(["encoder_z2_z1", "decoder_z1_z2"])
     mod_no_hooks_yes_grad = set(["l_encoder"])
     if not freeze_classifier:
         mod_no_hooks_yes_grad.add("classifier")
-    parameters_yes_grad = set(["background_pro_alpha", "background_pro_log_beta"])
+    mod_no_hooks_yes_grad = frozenset(mod_no_hooks_yes_grad)
+    parameters_yes_grad = ("background_pro_alpha", "background_pro_log_beta")
 
     def no_hook_cond(key):
         one = (not freeze_expression) and "encoder" in key
@@ -161,33 +166,28 @@ def _set_params_online_update(
         return one or two
 
     def requires_grad(key):
-        mod_name = key.split(".")[0]
-        # linear weights and bias that need grad
-        one = "fc_layers" in key and ".0." in key and mod_name not in mod_no_grad
+        mod_name = key.partition(".")[0]
         # modules that need grad
-        two = mod_name in mod_no_hooks_yes_grad
-        three = sum([p in key for p in parameters_yes_grad]) > 0
-        # batch norm option
-        four = (
-            "fc_layers" in key
-            and ".1." in key
-            and "encoder" in key
-            and (not freeze_batchnorm_encoder)
-        )
-        five = (
-            "fc_layers" in key
-            and ".1." in key
-            and "decoder" in key
-            and (not freeze_batchnorm_decoder)
-        )
-        if one or two or three or four or five:
+        if mod_name in mod_no_hooks_yes_grad:
             return True
-        else:
+        if any(p in key for p in parameters_yes_grad):
+            return True
+        if "fc_layers" not in key:
             return False
+        # linear weights and bias that need grad
+        if ".0." in key and mod_name not in mod_no_grad:
+            return True
+        # batch norm option
+        if ".1." in key:
+            if "encoder" in key and not freeze_batchnorm_encoder:
+                return True
+            if "decoder" in key and not freeze_batchnorm_decoder:
+                return True
+        return False
 
     for key, mod in module.named_modules():
         # skip over protected modules
-        if key.split(".")[0] in mod_no_hooks_yes_grad:
+        if key.partition(".")[0] in mod_no_hooks_yes_grad:
             continue
         if isinstance(mod, FCLayers):
             hook_first_layer = False if no_hook_cond(key) else True
@@ -203,7 +203,4 @@ def _set_params_online_update(
             mod.momentum = 0
 
     for key, par in module.named_parameters():
-        if requires_grad(key):
-            par.requires_grad = True
-        else:
-            par.requires_grad = False
+        par.requires_grad = requires_grad(key)
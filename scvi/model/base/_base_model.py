@@ -135,7 +135,7 @@ class BaseModelClass(ABC):
             else:
                 raise ValueError("Please run `adata = adata.copy()`")
 
-        if "_scvi" not in adata.uns_keys():
+        if "_scvi" not in adata.uns:
             logger.info(
                 "Input adata not setup with scvi. "
                 + "attempting to transfer anndata setup"
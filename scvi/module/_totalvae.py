@@ -125,6 +125,18 @@ class TOTALVAE(BaseModuleClass):
         self.protein_dispersion = protein_dispersion
         self.latent_distribution = latent_distribution
         self.protein_batch_mask = protein_batch_mask
+        if protein_batch_mask is not None:
+            # batches by proteins table, kept on the module device so that the
+            # loss only indexes it, batches without a mask count as observed
+            n_mask_rows = max(n_batch, max(int(b) for b in protein_batch_mask) + 1)
+            mask_table = np.ones((n_mask_rows, n_input_proteins), dtype=np.float32)
+            for b, mask in protein_batch_mask.items():
+                mask_table[int(b)] = mask
+            self.register_buffer(
+                "protein_batch_mask_table",
+                torch.from_numpy(mask_table),
+                persistent=False,
+            )
         self.use_observed_lib_size = use_observed_lib_size
         self.encode_covariates = encode_covariates
 
@@ -553,13 +565,9 @@ class TOTALVAE(BaseModuleClass):
         y = tensors[_CONSTANTS.PROTEIN_EXP_KEY]
 
         if self.protein_batch_mask is not None:
-            pro_batch_mask_minibatch = torch.zeros_like(y)
-            for b in torch.unique(batch_index):
-                b_indices = (batch_index == b).reshape(-1)
-                pro_batch_mask_minibatch[b_indices] = torch.tensor(
-                    self.protein_batch_mask[b.item()].astype(np.float32),
-                    device=y.device,
-                )
+            pro_batch_mask_minibatch = self.protein_batch_mask_table[
+                batch_index.reshape(-1).long()
+            ]
         else:
             pro_batch_mask_minibatch = None
 
@@ -1,8 +1,11 @@
 import os
 import tarfile
 
+import numpy as np
 import pytest
 import scanpy as sc
+import scipy.sparse as sp_sparse
+from scipy.io import mmwrite
 
 import scvi
 
@@ -47,6 +50,26 @@ def test_pbmc_cite(save_path):
     unsupervised_training_one_epoch(dataset)
 
 
+def test_read_10x_atac(save_path):
+    sp = os.path.join(save_path, "10X/atac_small")
+    os.makedirs(sp, exist_ok=True)
+    counts = sp_sparse.random(5, 8, density=0.4, format="coo", random_state=0)
+    counts.data = np.ceil(counts.data * 10)
+    # 10X stores peaks by cells
+    mmwrite(os.path.join(sp, "matrix.mtx"), counts)
+    with open(os.path.join(sp, "peaks.bed"), "w") as f:
+        for i in range(5):
+            f.write(f"chr1\t{100 * i}\t{100 * i + 50}\n")
+    with open(os.path.join(sp, "barcodes.tsv"), "w") as f:
+        for i in range(8):
+            f.write(f"CELL{i}-1\n")
+    adata = scvi.data.read_10x_atac(sp)
+    assert adata.shape == (8, 5)
+    assert sp_sparse.isspmatrix_csr(adata.X)
+    np.testing.assert_array_equal(adata.X.toarray(), counts.toarray().T)
+    assert adata.var_names[1] == "chr1:100-150"
+
+
 @pytest.mark.internet
 def test_download_dataset_10x(save_path):
     scvi.data.dataset_10x("hgmm_1k_v3", save_path=save_path)
@@ -1,10 +1,14 @@
+import os
+
+import anndata
 import numpy as np
+import pytest
 from scipy import sparse
 
 from scvi.data import poisson_gene_selection, synthetic_iid
 
 
-def test_poisson_gene_selection():
+def test_poisson_gene_selection(save_path):
     adata = synthetic_iid()
     n_top_genes = 10
     poisson_gene_selection(adata, batch_key="batch", n_top_genes=n_top_genes)
@@ -23,3 +27,24 @@ def test_poisson_gene_selection():
     adata.X = sparse.csr_matrix(adata.X)
     poisson_gene_selection(adata, batch_key="batch", n_top_genes=n_top_genes)
     assert np.sum(adata.var["highly_variable"]) == n_top_genes
+
+    adata = synthetic_iid()
+    adata.X = adata.X + 0.5
+    with pytest.raises(ValueError):
+        poisson_gene_selection(adata, batch_key="batch", n_top_genes=n_top_genes)
+
+    # backed, dense and sparse
+    adata = synthetic_iid()
+    path = os.path.join(save_path, "test_poisson_gene_selection.h5ad")
+    adata.write_h5ad(path)
+    adata = anndata.read_h5ad(path, backed="r+")
+    poisson_gene_selection(adata, batch_key="batch", n_top_genes=n_top_genes)
+    assert np.sum(adata.var["highly_variable"]) == n_top_genes
+
+    adata = synthetic_iid()
+    adata.X = sparse.csr_matrix(adata.X)
+    path = os.path.join(save_path, "test_poisson_gene_selection_sparse.h5ad")
+    adata.write_h5ad(path)
+    adata = anndata.read_h5ad(path, backed="r+")
+    poisson_gene_selection(adata, batch_key="batch", n_top_genes=n_top_genes)
+    assert np.sum(adata.var["highly_variable"]) == n_top_genes
@@ -23,6 +23,7 @@ def test_stereoscope(save_path):
     )
     st_model.train(max_epochs=1)
     st_model.get_proportions()
+    assert st_model.get_proportions(keep_noise=True).shape == (dataset.n_obs, 6)
     # test save/load
     st_model.save(save_path, overwrite=True, save_anndata=True)
     st_model = SpatialStereoscope.load(save_path)